@@ -122,9 +122,12 @@ def llm_image_description(state: GraphState) -> dict[str, ImageContentList]:
 
 def result_concatenation(state: GraphState) -> dict[str, NewspaperPage]:
     """Concatenate the results."""
-    newspaper_page_result = NewspaperPage(
-        **state.text_extraction_result.model_dump(),
-        images=state.image_description_result.images,
+    # Both parts are already validated, so skip re-running the validators
+    newspaper_page_result = NewspaperPage.from_trusted(
+        {
+            **{name: getattr(state.text_extraction_result, name) for name in NewspaperText.model_fields},
+            "images": state.image_description_result.images,
+        }
     )
     print(f"🔗 Results Concatenation complete: {state.image_path}")
     return {"newspaper_page_result": newspaper_page_result}
@@ -161,20 +164,20 @@ def corrector(state: GraphState) -> dict[str, NewspaperPage | int]:
     # Determine which fields need correction
     fields_to_correct = []
     if state.criteria:
-        criteria_dict = state.criteria.model_dump()
-        for criterion, score in criteria_dict.items():
-            if is_criterion(criterion, score) and score < CRITERIA_THRESHOLD and criterion in CRITERIA_TO_FIELDS:
+        criteria_scores = state.criteria.scores
+        for criterion, score in criteria_scores.items():
+            if score < CRITERIA_THRESHOLD and criterion in CRITERIA_TO_FIELDS:
                 fields_to_correct.extend(CRITERIA_TO_FIELDS[criterion])
         # Remove duplicates while preserving order
         fields_to_correct = list(dict.fromkeys(fields_to_correct))
 
-    newspaper_page_result = state.newspaper_page_result.model_copy()
+    newspaper_page_result = state.newspaper_page_result
 
     # If fields need correction, run the LLM to fix them
     if fields_to_correct:
         field_descriptions = []
-        for criterion, score in criteria_dict.items():
-            if is_criterion(criterion, score) and score < CRITERIA_THRESHOLD:
+        for criterion, score in criteria_scores.items():
+            if score < CRITERIA_THRESHOLD:
                 description = state.criteria.__class__.model_fields[criterion].description
                 field_descriptions.append(f"{description} was found to be inadequate (score: {score}/{CRITERIA_THRESHOLD})")
 
@@ -199,9 +202,9 @@ def corrector(state: GraphState) -> dict[str, NewspaperPage | int]:
         )
 
         # Only update the fields that needed correction
-        for field in fields_to_correct:
-            if hasattr(corrected_result, field):
-                setattr(newspaper_page_result, field, getattr(corrected_result, field))
+        newspaper_page_result = newspaper_page_result.model_copy(
+            update={field: getattr(corrected_result, field) for field in fields_to_correct if hasattr(corrected_result, field)}
+        )
 
         correction_attemps = state.correction_attemps + 1
     else:
@@ -1,8 +1,47 @@
+import io
+import re
+from collections.abc import Mapping
 from datetime import date
-from typing import Generator, Literal, Optional
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Literal, Optional
 
-import opencc
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
+
+if TYPE_CHECKING:
+    import opencc
+
+# Loading the conversion dictionaries is expensive, so build the converter lazily once per process
+_S2HK: "opencc.OpenCC | None" = None
+
+# Symbols that end a sentence, so the next line starts a new one instead of being concatenated
+_ENDING_SYMBOLS: frozenset[str] = frozenset((".", "。", "!", "?", ":", ";", "」", "』", "）", ")", "》", '"', "'", "*"))
+
+# Date formats, e.g. 2024年8月12日 and 2024-08-12 / 12/08/2024 / 08/13/2024
+_CN_DATE = re.compile(r"^\s*(\d{1,4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日")
+_NUM_DATE = re.compile(r"^\s*(\d{1,4})\s*([-/])\s*(\d{1,2})\s*\2\s*(\d{1,4})\s*$")
+
+
+def _get_converter() -> "opencc.OpenCC":
+    """Return the shared s2hk converter, importing opencc and loading its dictionaries on first use."""
+    global _S2HK
+    if _S2HK is None:
+        import opencc
+
+        _S2HK = opencc.OpenCC("s2hk")
+    return _S2HK
+
+
+@lru_cache(maxsize=8192)
+def _convert_cached(text: str) -> str:
+    return _get_converter().convert(text)
 
 
 def s2hk(v: Optional[str]) -> Optional[str]:
@@ -14,30 +53,30 @@ def s2hk(v: Optional[str]) -> Optional[str]:
     Returns:
         Optional[str]: Converted text or None.
     """
-    if v is not None:
-        converter = opencc.OpenCC("s2hk")
-        return converter.convert(v)
-    return v
+    # Nothing to convert for empty or pure-ASCII text such as romanized names
+    if not v or v.isascii():
+        return v
+    # Convert multi-line text line by line so recurring lines (headers, names) hit the cache
+    if "\n" in v:
+        return "\n".join(_convert_cached(line) for line in v.split("\n"))
+    return _convert_cached(v)
 
 
-class TableContent(BaseModel):
-    csv_string: str = Field(description="The content of the table in csv format")
-    caption: Optional[str] = Field(default=None, description="The caption or description of the table")
+# Strings converted to traditional Chinese (Hong Kong standard) after validation
+HKStr = Annotated[str, AfterValidator(s2hk)]
+OptHKStr = Annotated[Optional[str], AfterValidator(s2hk)]
 
-    @field_validator("csv_string", "caption", mode="after")
-    @classmethod
-    def s2hk_validator(cls, v: Optional[str]) -> Optional[str]:
-        return s2hk(v)
 
+class TableContent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    csv_string: HKStr = Field(description="The content of the table in csv format")
+    caption: OptHKStr = Field(default=None, description="The caption or description of the table")
 
-class ImageContent(BaseModel):
-    description: str = Field(description="Detailed description the single image based on the context of the page")
-    caption: Optional[str] = Field(default=None, description="The caption or title of the image")
 
-    @field_validator("description", "caption", mode="after")
-    @classmethod
-    def s2hk_validator(cls, v: Optional[str]) -> Optional[str]:
-        return s2hk(v)
+class ImageContent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    description: HKStr = Field(description="Detailed description the single image based on the context of the page")
+    caption: OptHKStr = Field(default=None, description="The caption or title of the image")
 
 
 # Dummy class for structured output
@@ -46,16 +85,18 @@ class ImageContentList(BaseModel):
 
 
 class NewspaperText(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     # Page metadata
     page_section_letter: Literal["A", "B", "C", "D", "E"] = Field(description="The page section letter (A-E), usually on the top left corner")
     page_section_number: int = Field(description="The page section number, usually on the top left corner", ge=0, le=100)
-    page_section_title: str = Field(description="The title of the page section, usually on the top left corner behind the page section letter and number")
+    page_section_title: HKStr = Field(description="The title of the page section, usually on the top left corner behind the page section letter and number")
     published_date: date | str = Field(description="The publication date of the newspaper")
-    author: Optional[str] = Field(default=None, description="The name of the author of the page")
-    photographer: Optional[str] = Field(default=None, description="The name of the photographer of the page")
+    author: OptHKStr = Field(default=None, description="The name of the author of the page")
+    photographer: OptHKStr = Field(default=None, description="The name of the photographer of the page")
 
     # Main content
-    content: str = Field(
+    content: HKStr = Field(
         description="The text content of the newspaper page including the titles / headers, excluding the metadata, organized into coherent paragraphs, where the titles are bolded, seperated by newlines '\n\n'"
     )
     tables: list[TableContent] = Field(default_factory=list, description="List of tables found on the page")
@@ -72,70 +113,94 @@ class NewspaperText(BaseModel):
         Returns:
             The date object
         """
-        # Chinese date format
-        if isinstance(v, str) and "年" in v and "月" in v and "日" in v:
+        if isinstance(v, str):
+            # ISO format, parsed in C
             try:
-                year = int(v.split("年")[0])
-                month = int(v.split("年")[1].split("月")[0])
-                day = int(v.split("月")[1].split("日")[0])
-                return date(year, month, day)
+                return date.fromisoformat(v)
             except ValueError:
                 pass
 
-        # Handle slash-separated date format
-        elif isinstance(v, str) and ("/" in v or "-" in v):
-            parts = v.split("/") if "/" in v else v.split("-")
-            try:
-                if len(parts) == 3:
-                    if len(parts[0]) == 4:
-                        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                    else:
-                        if int(parts[1]) > 12:
-                            month, day, year = int(parts[0]), int(parts[1]), int(parts[2])
-                        else:
-                            day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
-                    return date(year, month, day)
-            except ValueError:
-                pass
+            # Chinese date format
+            if m := _CN_DATE.match(v):
+                try:
+                    return date(int(m[1]), int(m[2]), int(m[3]))
+                except ValueError:
+                    pass
+
+            # Slash or dash separated date format
+            elif m := _NUM_DATE.match(v):
+                first, second, third = m[1], int(m[3]), int(m[4])
+                try:
+                    if len(first) == 4:
+                        return date(int(first), second, third)
+                    # Ambiguous order, assume MM/DD/YYYY only when the middle part cannot be a month
+                    if second > 12:
+                        return date(third, int(first), second)
+                    return date(third, second, int(first))
+                except ValueError:
+                    pass
 
         return v
 
-    @field_validator("page_section_title", "author", "photographer", "content", mode="after")
-    @classmethod
-    def s2hk_validator(cls, v: Optional[str]) -> Optional[str]:
-        return s2hk(v)
-
     @field_validator("content", mode="after")
     @classmethod
     def format_content(cls, content: str) -> str:
-        def concatenate_sentences(text: str) -> Generator[str, None, None]:
-            ending_symbols = (".", "。", "!", "?", ":", ";", "」", "』", "）", ")", "》", '"', "'", "*")
-            current_sentence = ""
-            for line in text.splitlines():
-                if not line.strip():
-                    if current_sentence:
-                        yield current_sentence
-                        current_sentence = ""
-                    yield ""
-                    continue
-                if not current_sentence:
-                    current_sentence = line
-                elif current_sentence[-1] in ending_symbols or line.startswith("**"):
-                    yield current_sentence
-                    current_sentence = line
-                else:
-                    current_sentence += line
-            if current_sentence:
-                yield current_sentence
-
-        concatenated_sentences = list(concatenate_sentences(content))
-        return "\n".join(concatenated_sentences)
+        # Concatenate broken lines into sentences in a single pass, streaming them into one buffer
+        lines = content.splitlines()
+        blanks = [not line.strip() for line in lines]
+        bolds = [line[:2] == "**" for line in lines]
+
+        buffer = io.StringIO()
+        current_sentence = ""
+        last_char = ""  # Last character of the current sentence, tracked to avoid reindexing
+        for line, blank, bold in zip(lines, blanks, bolds):
+            if blank:
+                if current_sentence:
+                    buffer.write(current_sentence)
+                    buffer.write("\n")
+                    current_sentence = ""
+                buffer.write("\n")
+                continue
+            if not current_sentence:
+                current_sentence = line
+            elif last_char in _ENDING_SYMBOLS or bold:
+                buffer.write(current_sentence)
+                buffer.write("\n")
+                current_sentence = line
+            else:
+                current_sentence += line
+            last_char = line[-1]
+        buffer.write(current_sentence)
+
+        # Every sentence is followed by a newline except the last, so drop the trailing one left by a blank line
+        output = buffer.getvalue()
+        return output[:-1] if not current_sentence and output else output
 
 
 # Inherit the NewspaperText class and concatenate with the images list
 class NewspaperPage(NewspaperText):
     images: list[ImageContent] = Field(default_factory=list, description="List of images found on the page")
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "NewspaperPage":
+        """Build a page without re-running the validators.
+
+        Only use this for data that has already passed full validation once, e.g. the output of `model_dump` or a serialization round-trip.
+
+        Args:
+            data (dict): Already validated page data, where tables and images may be dicts or model instances.
+
+        Returns:
+            NewspaperPage: The constructed page.
+        """
+        return cls.model_construct(
+            **{
+                **data,
+                "tables": [table if isinstance(table, TableContent) else TableContent.model_construct(**table) for table in data.get("tables", [])],
+                "images": [image if isinstance(image, ImageContent) else ImageContent.model_construct(**image) for image in data.get("images", [])],
+            }
+        )
+
     @property
     def as_str(self) -> str:
         """Aggregate the result into a single string."""
@@ -150,26 +215,44 @@ class NewspaperPage(NewspaperText):
             "",
             "=====CONTENT=====",
             f"Content: {self.content}",
+            "",
+            "=====TABLES=====",
         ]
+        for i, table in enumerate(self.tables, start=1):
+            output += (f"Table {i} Content:\n{table.csv_string}", f"Table {i} Caption: {table.caption}")
 
-        output.append("")
-        output.append("=====TABLES=====")
-        for i, table in enumerate(self.tables):
-            output.append(f"Table {i+1} Content:\n{table.csv_string}")
-            output.append(f"Table {i+1} Caption: {table.caption}")
-
-        output.append("")
-        output.append("=====IMAGES=====")
-        for i, image in enumerate(self.images):
-            output.append(f"Image {i+1} Description: {image.description}")
-            output.append(f"Image {i+1} Caption: {image.caption}")
+        output += ("", "=====IMAGES=====")
+        for i, image in enumerate(self.images, start=1):
+            output += (f"Image {i} Description: {image.description}", f"Image {i} Caption: {image.caption}")
 
         return "\n".join(output)
 
 
+@cache
+def _page_list_adapter() -> TypeAdapter[list[NewspaperPage]]:
+    """Return the shared adapter for validating a whole batch of pages in one pass, building its schema on first use."""
+    return TypeAdapter(list[NewspaperPage])
+
+
+def validate_pages(data: str | bytes | list[dict]) -> list[NewspaperPage]:
+    """Validate a batch of pages from JSON or Python objects.
+
+    Args:
+        data (str | bytes | list[dict]): JSON array of pages or a list of page dicts.
+
+    Returns:
+        list[NewspaperPage]: The validated pages.
+    """
+    if isinstance(data, (str, bytes)):
+        return _page_list_adapter().validate_json(data)
+    return _page_list_adapter().validate_python(data)
+
+
 class Criteria(BaseModel):
     """Criteria for the results."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Page Metadata criteria
     page_section_letter: int = Field(description="Verify the page section letter is correctly extracted from the top left corner", ge=0, le=10)
     page_section_number: int = Field(description="Verify the page section number is correctly extracted from the top left corner", ge=0, le=10)
@@ -205,26 +288,35 @@ class Criteria(BaseModel):
     # Overall Assessment
     reasons: str = Field(description="Provide detailed reasons for any criteria not met, with specific examples of errors or omissions")
 
-
-CRITERIA_TO_FIELDS: dict[str, list[str]] = {
-    "page_section_letter": ["page_section_letter"],
-    "page_section_number": ["page_section_number"],
-    "page_section_title": ["page_section_title"],
-    "published_date": ["published_date"],
-    "author": ["author"],
-    "photographer": ["photographer"],
-    "text_headers": ["content"],
-    "text_content_completeness": ["content"],
-    "text_content_accuracy": ["content"],
-    "text_content_flow": ["content"],
-    "text_formatting": ["content"],
-    "tables_included": ["tables"],
-    "tables_structure": ["tables"],
-    "tables_csv_format": ["tables"],
-    "tables_caption": ["tables"],
-    "tables_no_extra": ["tables"],
-    "images_included": ["images"],
-    "images_caption": ["images"],
-    "images_description": ["images"],
-    "images_no_extra": ["images"],
-}
+    @property
+    def scores(self) -> dict[str, int]:
+        """Map each criterion to its score, excluding the reasons."""
+        scores = self.model_dump()
+        del scores["reasons"]
+        return scores
+
+
+CRITERIA_TO_FIELDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "page_section_letter": ("page_section_letter",),
+        "page_section_number": ("page_section_number",),
+        "page_section_title": ("page_section_title",),
+        "published_date": ("published_date",),
+        "author": ("author",),
+        "photographer": ("photographer",),
+        "text_headers": ("content",),
+        "text_content_completeness": ("content",),
+        "text_content_accuracy": ("content",),
+        "text_content_flow": ("content",),
+        "text_formatting": ("content",),
+        "tables_included": ("tables",),
+        "tables_structure": ("tables",),
+        "tables_csv_format": ("tables",),
+        "tables_caption": ("tables",),
+        "tables_no_extra": ("tables",),
+        "images_included": ("images",),
+        "images_caption": ("images",),
+        "images_description": ("images",),
+        "images_no_extra": ("images",),
+    }
+)